@@ -36,6 +36,7 @@ setup(
         "Programming Language :: Python :: 3.8",
     ],
     extras_require={
+        "orjson": ["orjson>=3.1"],
         "dev": [
             "pylint",
             "pytest-cov",
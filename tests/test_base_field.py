@@ -0,0 +1,499 @@
+"""Field tests"""
+
+# Copyright 2019 mickybart
+
+# This file is part of python-typing-engine.
+
+# python-typing-engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# python-typing-engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-typing-engine.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import datetime
+import enum
+import pickle
+import unittest
+
+from typing_engine.errors import UnsupportedOperation
+from typing_engine.typing import Typing2, Field, vField
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class TestCompiledAccessors(unittest.TestCase):
+    def test_setters_and_getters_order(self):
+        calls = []
+
+        def s1(instance, value):
+            calls.append("s1")
+            return (value or 0) + 1
+
+        def s2(instance, value):
+            calls.append("s2")
+            return (value or 0) * 10
+
+        def g1(instance, value):
+            calls.append("g1")
+            return value + 1
+
+        def g2(instance, value):
+            calls.append("g2")
+            return value * 2
+
+        class T(Typing2):
+            v = Field().setters(s1).setters(s2).getters(g1).getters(g2)
+
+        t = T()
+        t.v = 3
+        del calls[:]
+        self.assertEqual(t._v, 40)
+        self.assertEqual(t.v, 81)
+        self.assertEqual(calls, ["g2", "g1"])
+
+    def test_bound_methods(self):
+        class Helper:
+            def getter(self, value):
+                return ("get", value)
+
+            def setter(self, value):
+                return ("set", value)
+
+        helper = Helper()
+
+        class T(Typing2):
+            a = Field(default=1).getters(helper.getter)
+            b = Field().setters(helper.setter)
+
+        t = T()
+        t.b = 2
+        self.assertEqual(t.a, ("get", 1))
+        self.assertEqual(t.b, ("set", 2))
+
+    def test_setters_added_after_use(self):
+        class T(Typing2):
+            a = Field()
+
+        t = T({"a": 1})
+        T.a.setters(lambda i, v: v * 2)
+        t.loads_from_dict({"a": 2})
+        self.assertEqual(t.a, 4)
+
+    def test_setter_reading_field_during_init(self):
+        seen = []
+
+        class T(Typing2):
+            def setter_a(self, value):
+                seen.append(self.a)
+                return value
+
+            a = Field(default=5).setters(setter_a)
+
+        self.assertEqual(T().a, 5)
+        self.assertEqual(seen, [None])
+
+
+class TestStorage(unittest.TestCase):
+    def test_plain_object(self):
+        field = Field(name="x", default=10)
+
+        class Plain:
+            pass
+
+        plain = Plain()
+        self.assertIs(field.__get__(None, Plain), field)
+        self.assertEqual(field.__get__(plain, Plain), 10)
+        field.__set__(plain, 3)
+        self.assertEqual(plain._x, 3)
+        field.__delete__(plain)
+        self.assertEqual(field.__get__(plain, Plain), 10)
+
+    def test_slots_object(self):
+        class Slotted:
+            __slots__ = ("_x", "_items")
+            x = Field(name="x", default=1).getters(lambda i, v: v * 10)
+            items = Field(name="items").list_of()
+
+        slotted = Slotted()
+        self.assertEqual(slotted.x, 10)
+        slotted.x = 2
+        slotted.items.append(1)
+        self.assertEqual(slotted.x, 20)
+        self.assertEqual(slotted.items, [1])
+        self.assertEqual(Slotted.x.direct_get(slotted), 2)
+
+        Slotted.x.direct_set(slotted, 3)
+        self.assertEqual(slotted.x, 30)
+
+        del slotted.x
+        Slotted.x.__delete__(slotted)
+        with self.assertRaisesRegex(AttributeError, "_x"):
+            Slotted.x.direct_get(slotted)
+        self.assertEqual(slotted.x, 10)
+
+    def test_owner_setattr(self):
+        names = []
+
+        class T(Typing2):
+            a = Field(default=1)
+
+            def __setattr__(self, name, value):
+                names.append(name)
+                super().__setattr__(name, value)
+
+        t = T()
+        t.a = 2
+        self.assertEqual(t.a, 2)
+        self.assertIn("_a", names)
+
+        del names[:]
+        t.loads_from_dict({"a": 3})
+        self.assertEqual(names, ["a", "_a"])
+
+    def test_owner_getattr(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+            def __getattr__(self, name):
+                return "ga"
+
+        t = T()
+        self.assertEqual(t.a, "ga")
+        self.assertEqual(T.a.direct_get(t), "ga")
+        self.assertEqual(t.dumps(), {"a": "ga"})
+
+    def test_subclass_with_setattr(self):
+        names = []
+
+        class Base:
+            x = Field(name="x", default=1)
+
+        class Sub(Base):
+            def __setattr__(self, name, value):
+                names.append(name)
+                super().__setattr__(name, value)
+
+        base = Base()
+        self.assertEqual(base.x, 1)
+        self.assertEqual(names, [])
+
+        sub = Sub()
+        sub.x = 2
+        self.assertEqual(sub.x, 2)
+        self.assertEqual(names, ["x", "_x"])
+        self.assertEqual(base.x, 1)
+
+
+class TestConverters(unittest.TestCase):
+    def test_converters(self):
+        class T(Typing2):
+            a = Field().converter(loads=int, dumps=str)
+
+        t = T({"a": "5"})
+        self.assertEqual(t.a, 5)
+        self.assertEqual(t.dumps(), {"a": "5"})
+        self.assertEqual(t.dumps(raw=True), {"a": 5})
+
+        t.a = None
+        self.assertIsNone(t.a)
+        self.assertEqual(t.dumps(), {"a": None})
+
+
+class TestvField(unittest.TestCase):
+    def test_virtual_value(self):
+        class T(Typing2):
+            real = Field(default=1)
+
+            def vget(self, value):
+                return self.real * 2
+
+            def vset(self, value):
+                self.real = value
+                return value
+
+            v = vField(default=5).getters(vget).setters(vset).converter(loads=int)
+
+        t = T()
+        self.assertEqual(t.v, 2)
+        t.loads_from_dict({"v": "4"})
+        self.assertEqual(t.real, 4)
+        self.assertEqual(t.dumps(), {"real": 4, "v": 8})
+        self.assertNotIn("_v", t.__dict__)
+
+        with self.assertRaises(UnsupportedOperation):
+            T.v.direct_get(t)
+        with self.assertRaises(UnsupportedOperation):
+            T.v.direct_set(t, 1)
+
+
+class TestReset(unittest.TestCase):
+    def test_reset_and_delete(self):
+        class T(Typing2):
+            a = Field(default=1)
+            items = Field().list_of()
+
+        t = T({"a": 2, "items": [1]})
+        del t.a
+        self.assertEqual(t.a, 1)
+        t.reset()
+        self.assertEqual(t.dumps(), {"a": 1, "items": []})
+
+
+class TestMatch(unittest.TestCase):
+    def test_match(self):
+        field = Field(name="a").mapping("A")
+        self.assertTrue(field.match("a"))
+        self.assertTrue(field.match("A"))
+        self.assertFalse(field.match("b"))
+        field.mapping(None)
+        self.assertFalse(field.match("A"))
+
+    def test_name_set_after_use(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": 1})
+
+        T.a.name = "b"
+        self.assertTrue(T.a.match("b"))
+        self.assertFalse(T.a.match("a"))
+        self.assertEqual(T.a.get_name(), "b")
+        self.assertEqual(T.a.instance_name, "_b")
+        self.assertIs(t.get_field("b"), T.a)
+
+        t.a = 3
+        self.assertEqual(t.__dict__["_b"], 3)
+        # the class attribute is still named a
+        with self.assertRaises(AttributeError):
+            T({"b": 5})
+
+
+class TestFieldCopy(unittest.TestCase):
+    def test_copy(self):
+        field = Field(name="a", default=1).mapping("A").hide().list_of()
+        field.getters(lambda i, v: v)
+        copied = field.copy()
+
+        self.assertIsNot(copied, field)
+        self.assertEqual(copied.name, "a")
+        self.assertEqual(copied.get_name(), "A")
+        self.assertEqual(copied.get_name(no_mapping=True), "a")
+        self.assertTrue(copied.hidden)
+        self.assertTrue(copied.is_list)
+        self.assertEqual(copied.getters_funcs, field.getters_funcs)
+        self.assertIsNot(copied.getters_funcs, field.getters_funcs)
+
+    def test_pickle(self):
+        class T(Typing2):
+            a = Field(default=1).mapping("A").converter(loads=int)
+
+        t = T({"A": "2"})
+        self.assertEqual(t.a, 2)
+
+        field = pickle.loads(pickle.dumps(T.a))
+        self.assertEqual(field.get_name(), "A")
+        self.assertEqual(field.get_name(no_mapping=True), "a")
+        self.assertIs(field.loads_converter, int)
+        self.assertIs(field.getters_funcs.field, field)
+
+        class U(Typing2):
+            a = field
+
+        self.assertEqual(U({"A": "3"}).a, 3)
+        self.assertEqual(t.a, 2)
+
+        fields = pickle.loads(pickle.dumps(t.get_fields()))
+        self.assertEqual([f.name for f in fields], ["a"])
+
+
+class TestChainsChangedAfterUse(unittest.TestCase):
+    def test_getters_added_after_use(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+        t = T()
+        self.assertEqual(t.a, 1)
+        self.assertEqual(t.dumps(), {"a": 1})
+
+        T.a.getters(lambda i, v: v + 100)
+        self.assertEqual(t.a, 101)
+        self.assertEqual(t.dumps(), {"a": 101})
+
+        T.a.getters(clear=True)
+        self.assertEqual(t.a, 1)
+
+    def test_converter_changed_after_use(self):
+        class T(Typing2):
+            a = Field(default=1).converter(dumps=str)
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": "1"})
+        T.a.converter(dumps=float)
+        self.assertEqual(t.dumps(), {"a": 1.0})
+
+    def test_options_set_directly_after_use(self):
+        class T(Typing2):
+            a = Field(default=1)
+            b = Field()
+
+        t = T()
+        self.assertEqual(t.a, 1)
+        self.assertEqual(t.dumps(), {"a": 1, "b": None})
+
+        T.a.getters_funcs.append(lambda i, v: v + 100)
+        self.assertEqual(t.a, 101)
+        T.a.getters_funcs = []
+        self.assertEqual(t.a, 1)
+
+        T.a.hidden = True
+        self.assertEqual(t.dumps(), {"b": None})
+        T.a.hidden = False
+
+        T.a.mapping_name = "A"
+        self.assertEqual(t.dumps(), {"A": 1, "b": None})
+        self.assertIs(t.get_field("A"), T.a)
+
+        T.a.loads_converter = int
+        t.a = "2"
+        self.assertEqual(t.a, 2)
+
+        T.b.instanciator = list
+        self.assertEqual(T().b, [])
+
+
+class TestDirectAccess(unittest.TestCase):
+    def test_direct_get_and_set(self):
+        class T(Typing2):
+            a = Field().converter(loads=int).setters(lambda i, v: v + 1)
+
+        t = T()
+        T.a.direct_set(t, "5")
+        self.assertEqual(T.a.direct_get(t), 5)
+        T.a.direct_set(t, "5", bypass_converter=True)
+        self.assertEqual(T.a.direct_get(t), "5")
+
+        del t.a
+        with self.assertRaisesRegex(AttributeError, "_a"):
+            T.a.direct_get(t)
+
+    def test_direct_get_stored_none(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+        t = T()
+        T.a.direct_set(t, None)
+        self.assertIsNone(T.a.direct_get(t))
+        self.assertIsNone(t.a)
+
+
+class TestStoredDefault(unittest.TestCase):
+    def test_default_value(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+        t = T()
+        self.assertNotIn("_a", t.__dict__)
+        self.assertEqual(t.a, 1)
+        self.assertEqual(t._a, 1)
+
+    def test_default_goes_through_setters_and_getters(self):
+        calls = []
+
+        class T(Typing2):
+            a = (
+                Field(default="1")
+                .converter(loads=int)
+                .setters(lambda i, v: calls.append(("set", v)) or v + 1)
+                .getters(lambda i, v: v * 10)
+            )
+
+        t = T()
+        self.assertEqual(t.a, 20)
+        self.assertEqual(t._a, 2)
+        self.assertEqual(calls, [("set", 1)])
+
+
+class TestInstanciator(unittest.TestCase):
+    def test_instanciator(self):
+        class T(Typing2):
+            items = Field().list_of()
+            mapping = Field(instanciator=dict)
+
+        t1 = T()
+        t2 = T()
+        t1.items.append(1)
+        t1.mapping["k"] = "v"
+        self.assertEqual(t2.items, [])
+        self.assertEqual(t2.mapping, {})
+        self.assertEqual(t1.dumps(), {"items": [1], "mapping": {"k": "v"}})
+
+    def test_typing_instanciator_gets_parent(self):
+        class Child(Typing2):
+            x = Field(default=0)
+
+        class T(Typing2):
+            child = Field(instanciator=Child)
+
+        t = T()
+        self.assertIsInstance(t.child, Child)
+        self.assertIs(t.child.parent, t)
+
+
+class TestConverterHelpers(unittest.TestCase):
+    def test_converter_attr(self):
+        class T(Typing2):
+            color = Field().converter_attr(dumps="value")
+            real = Field().converter_attr(loads="real", dumps="imag")
+
+        t = T({"real": 3 + 4j})
+        t.color = Color.RED
+        self.assertIs(t.color, Color.RED)
+        self.assertEqual(t.real, 3.0)
+        self.assertEqual(t.dumps(), {"color": "red", "real": 0.0})
+        self.assertEqual(t.dumps(raw=True), {"color": Color.RED, "real": 3.0})
+
+    def test_converter_method(self):
+        class T(Typing2):
+            date = Field().converter_method(dumps="isoformat")
+            name = Field().converter_method(loads="strip", dumps="upper")
+
+        t = T({"date": datetime.date(2019, 1, 2), "name": " abc "})
+        self.assertEqual(t.name, "abc")
+        self.assertEqual(t.dumps(), {"date": "2019-01-02", "name": "ABC"})
+
+    def test_none_is_not_converted(self):
+        class T(Typing2):
+            color = Field().converter_attr(loads="value", dumps="value")
+            date = Field().converter_method(loads="date", dumps="isoformat")
+
+        t = T({"color": None, "date": None})
+        self.assertIsNone(t.color)
+        self.assertEqual(t.dumps(), {"color": None, "date": None})
+
+    def test_keep_other_converter(self):
+        class T(Typing2):
+            a = Field().converter(loads=int).converter_method(dumps="bit_length")
+
+        t = T({"a": "4"})
+        self.assertEqual(t.a, 4)
+        self.assertEqual(t.dumps(), {"a": 3})
+
+    def test_after_use(self):
+        class T(Typing2):
+            color = Field(default=Color.RED)
+
+        t = T()
+        self.assertEqual(t.dumps(), {"color": Color.RED})
+        self.assertIs(T.color.converter_attr(dumps="name"), T.color)
+        self.assertEqual(t.dumps(), {"color": "RED"})
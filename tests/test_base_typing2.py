@@ -0,0 +1,694 @@
+"""Typing2 tests"""
+
+# Copyright 2019 mickybart
+
+# This file is part of python-typing-engine.
+
+# python-typing-engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# python-typing-engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-typing-engine.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import datetime
+import enum
+import importlib.util
+import io
+import json
+import sys
+import types
+import unittest
+import uuid
+from unittest import mock
+
+from typing_engine import typing as typing_module
+from typing_engine.typing import Typing2, Field
+
+
+class Item(Typing2):
+    id = Field()
+    label = Field(default="none")
+
+
+class Owner(Typing2):
+    name = Field().mapping("Name")
+    item = Field(instanciator=Item)
+    items = Field().list_of(Item)
+    tags = Field().list_of()
+    secret = Field(default="s").hide()
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class JsonBackendsMixin:
+    def check_both(self, check):
+        """Run check() with orjson (when installed) and without it"""
+        if typing_module.orjson is not None:
+            with self.subTest(backend="orjson"):
+                check()
+        with self.subTest(backend="json"):
+            with mock.patch.object(typing_module, "orjson", None):
+                check()
+
+
+class TestDispatch(unittest.TestCase):
+    def test_getters(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": 1})
+
+        T.a.getters(lambda i, v: v * 10)
+        self.assertEqual(t.dumps(), {"a": 10})
+        self.assertEqual(t.dumps(raw=True), {"a": 10})
+
+    def test_other_class_not_affected(self):
+        class A(Typing2):
+            a = Field(default=1)
+
+        class B(Typing2):
+            b = Field(default=2)
+
+        a = A()
+        b = B()
+        self.assertEqual(a.dumps(), {"a": 1})
+        self.assertEqual(b.dumps(), {"b": 2})
+
+        B.b.hide()
+        self.assertEqual(a.dumps(), {"a": 1})
+        self.assertEqual(b.dumps(), {})
+
+    def test_transform_fields(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+            @classmethod
+            def transform_fields(cls):
+                cls.a.mapping("A")
+
+        self.assertEqual(T().dumps(), {"A": 1})
+        self.assertEqual(T({"A": 2}).a, 2)
+
+    def test_unhashable_converter(self):
+        class Mapper:
+            # unhashable like a dataclass with eq=True
+            __hash__ = None
+
+            def __init__(self, values):
+                self.values = values
+
+            def __call__(self, value):
+                return self.values[value]
+
+        class T(Typing2):
+            a = Field(default="x").converter(dumps=Mapper({"x": "X"}))
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": "X"})
+        T.a.hide()
+        T.a.unhide()
+        self.assertEqual(t.dumps(), {"a": "X"})
+
+    def test_overridden_get_fields(self):
+        class T(Typing2):
+            a = Field(default=1)
+            b = Field(default=2)
+
+            def get_fields(self):
+                return [field for field in super().get_fields() if field.name != "b"]
+
+        t = T({"a": 3, "b": 4})
+        self.assertEqual(t.dumps(), {"a": 3})
+        self.assertEqual(T(t).dumps(raw=True), {"a": 3})
+
+        t.reset()
+        self.assertEqual(t.a, 1)
+        self.assertEqual(t.b, 4)
+
+    def test_overridden_get_field(self):
+        class T(Typing2):
+            a = Field()
+
+            def get_field(self, name):
+                return super().get_field(name.lower())
+
+        t = T({"A": 3})
+        self.assertEqual(t.a, 3)
+        self.assertEqual(T(t).a, 3)
+
+    def test_plain_fields_list(self):
+        class T(Typing2):
+            a = Field(default=1)
+            b = Field(default=2)
+
+        t = T()
+        fields = [T.a]
+        T._Typing2__fields = fields
+        self.assertEqual(t.dumps(), {"a": 1})
+
+        fields.append(T.b)
+        self.assertEqual(t.dumps(), {"a": 1, "b": 2})
+        t.loads_from_dict({"b": 3})
+        self.assertEqual(t.b, 3)
+
+
+class TestBytes(JsonBackendsMixin, unittest.TestCase):
+    def test_bytes(self):
+        owner = Owner({"Name": "été", "items": [{"id": 1}]})
+        copied = Owner(owner.encode())
+        self.assertEqual(copied.dumps(raw=True), owner.dumps(raw=True))
+
+    def test_long_digit_runs(self):
+        data = b'{"id": 18446744073709551616, "label": "12345678901234567890"}'
+
+        def check():
+            item = Item(data)
+            self.assertEqual(item.id, 2**64)
+            self.assertIs(type(item.id), int)
+            self.assertEqual(item.label, "12345678901234567890")
+
+        self.check_both(check)
+
+    def test_other_encoding(self):
+        data = '{"label": "été"}'.encode("latin-1")
+
+        def check():
+            item = Item()
+            item.loads_from_bytes(data, encoding="latin-1")
+            self.assertEqual(item.label, "été")
+
+        self.check_both(check)
+
+
+class TestDumpsPlans(unittest.TestCase):
+    def test_hide(self):
+        class T(Typing2):
+            a = Field(default=1)
+            b = Field(default=2)
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": 1, "b": 2})
+
+        T.b.hide()
+        self.assertEqual(t.dumps(), {"a": 1})
+        self.assertEqual(t.dumps(raw=True), {"a": 1, "b": 2})
+
+        T.b.unhide()
+        self.assertEqual(t.dumps(), {"a": 1, "b": 2})
+
+    def test_mapping(self):
+        class T(Typing2):
+            a = Field()
+
+        t = T({"a": 1})
+        self.assertEqual(t.dumps(), {"a": 1})
+
+        T.a.mapping("A")
+        t.loads_from_dict({"A": 2})
+        self.assertEqual(t.a, 2)
+        self.assertEqual(t.dumps(), {"A": 2})
+
+        T.a.mapping(None)
+        t.loads_from_dict({"A": 3, "a": 4})
+        self.assertEqual(t.dumps(), {"a": 4})
+
+
+class TestCopySameClass(unittest.TestCase):
+    def test_same_class(self):
+        owner = Owner(
+            {"Name": "o", "item": {"id": 1}, "items": [{"id": 2}], "tags": ["a"]}
+        )
+        copied = Owner(owner)
+
+        self.assertEqual(copied.dumps(raw=True), owner.dumps(raw=True))
+        self.assertIsNot(copied.item, owner.item)
+        self.assertIs(copied.item.parent, copied)
+        self.assertIsNot(copied.items[0], owner.items[0])
+        self.assertIs(copied.items[0].parent, copied)
+        self.assertIsNot(copied.tags, owner.tags)
+
+        copied.items[0].id = 10
+        copied.tags.append("b")
+        self.assertEqual(owner.items[0].id, 2)
+        self.assertEqual(owner.tags, ["a"])
+
+    def test_converters_applied_once(self):
+        class T(Typing2):
+            a = Field(default=0).converter(loads=int).setters(lambda i, v: v + 1)
+
+        t = T({"a": "1"})
+        self.assertEqual(T(t).a, 3)
+        self.assertEqual(t.a, 2)
+
+    def test_hooks(self):
+        calls = []
+
+        class T(Typing2):
+            a = Field()
+
+            def pre_loads(self, data):
+                calls.append("pre")
+                return data
+
+            def post_dumps(self, raw, dump):
+                dump["a"] = dump["a"] * 2
+
+        t = T()
+        t.a = 1
+        self.assertEqual(T(t).a, 2)
+        self.assertEqual(calls, ["pre"])
+
+    def test_custom_init_item(self):
+        class CustomItem(Typing2):
+            id = Field()
+
+            def __init__(self, data=None, parent=None):
+                self.key = data["id"] if data else None
+                super().__init__(data, parent)
+
+        class T(Typing2):
+            items = Field().list_of(CustomItem)
+
+        t = T({"items": [{"id": 1}]})
+        copied = T(t)
+        self.assertEqual(copied.items[0].key, 1)
+        self.assertEqual(copied.dumps(), {"items": [{"id": 1}]})
+
+    def test_overridden_loads_from_typing(self):
+        calls = []
+
+        class Child(Typing2):
+            id = Field()
+
+            def loads_from_typing(self, other):
+                calls.append(other.id)
+                super().loads_from_typing(other)
+
+        class T(Typing2):
+            child = Field(instanciator=Child)
+            children = Field().list_of(Child)
+
+        t = T({"child": {"id": 1}, "children": [{"id": 2}]})
+        copied = T(t)
+        self.assertEqual(copied.dumps(), {"child": {"id": 1}, "children": [{"id": 2}]})
+        # nested objects are loaded from their raw dump, not by loads_from_typing()
+        self.assertEqual(calls, [])
+
+
+class TestCompiledLoaders(unittest.TestCase):
+    def test_loads_and_dumps(self):
+        data = {
+            "Name": "owner",
+            "item": {"id": 1},
+            "items": [{"id": 2, "label": "two"}, {"id": 3}],
+            "tags": ["a", "b"],
+            "unknown": True,
+        }
+        owner = Owner(data)
+
+        self.assertEqual(owner.name, "owner")
+        self.assertIsInstance(owner.item, Item)
+        self.assertIs(owner.item.parent, owner)
+        self.assertEqual([item.id for item in owner.items], [2, 3])
+        self.assertTrue(all(item.parent is owner for item in owner.items))
+        self.assertEqual(
+            owner.dumps(),
+            {
+                "Name": "owner",
+                "item": {"id": 1, "label": "none"},
+                "items": [{"id": 2, "label": "two"}, {"id": 3, "label": "none"}],
+                "tags": ["a", "b"],
+            },
+        )
+        self.assertEqual(owner.dumps(raw=True)["secret"], "s")
+
+    def test_loads_merges(self):
+        owner = Owner({"item": {"id": 1, "label": "one"}, "tags": ["a"]})
+        item = owner.item
+        owner.loads_from_dict({"item": {"id": 2}, "tags": ["b"]})
+
+        self.assertIs(owner.item, item)
+        self.assertEqual(owner.item.dumps(), {"id": 2, "label": "one"})
+        self.assertEqual(owner.tags, ["a", "b"])
+
+    def test_loads_hooks(self):
+        calls = []
+
+        class T(Typing2):
+            a = Field()
+
+            def pre_loads(self, data):
+                calls.append("pre")
+                return {"a": data["b"]}
+
+            def post_loads(self):
+                calls.append("post")
+
+        t = T({"b": 1})
+        self.assertEqual(t.a, 1)
+        self.assertEqual(calls, ["pre", "post"])
+
+
+class TestInheritance(unittest.TestCase):
+    def test_inheritance(self):
+        class Child(Item):
+            extra = Field(default=0)
+
+        child = Child({"id": 1, "extra": 2})
+        self.assertEqual(child.dumps(), {"id": 1, "label": "none", "extra": 2})
+        self.assertEqual(Item().dumps(), {"id": None, "label": "none"})
+        self.assertIsNot(Child.get_field(child, "id"), Item.id)
+
+    def test_inherited_name_matched(self):
+        class Parent(Typing2):
+            ABC = Field(default=1)
+            other = Field(default=2)
+
+        class Child(Parent):
+            abc = CaseInsensitiveField(default=3)
+
+        self.assertEqual(Child().dumps(), {"abc": 3, "other": 2})
+
+    def test_inherited_name_overridden_get_field(self):
+        class Parent(Typing2):
+            ABC = Field(default=1)
+
+        class Child(Parent):
+            abc = Field(default=3)
+
+            def get_field(self, name):
+                return super().get_field(name.lower())
+
+        self.assertEqual(Child().dumps(), {"abc": 3})
+
+
+class TestDumpsManyAsCsv(unittest.TestCase):
+    def test_dumps_many_as_csv(self):
+        items = [Item({"id": 1, "label": "one"}), Item({"id": 2})]
+
+        self.assertEqual(
+            Item.dumps_many_as_csv(items), "".join(i.dumps_as_csv() for i in items)
+        )
+        self.assertEqual(
+            Item.dumps_many_as_csv(items, include_header=True),
+            '"id","label"\n1,"one"\n2,"none"\n',
+        )
+        self.assertEqual(
+            Item.dumps_many_as_csv(items, dialect="excel"), '1,"one"\r\n2,"none"\r\n'
+        )
+
+    def test_dumps_many_as_csv_raw(self):
+        class T(Typing2):
+            a = Field(default=1).converter(dumps=str)
+            b = Field(default=2).hide()
+
+        self.assertEqual(T.dumps_many_as_csv([T()]), '"1"\n')
+        self.assertEqual(T.dumps_many_as_csv([T()], raw=True), "1,2\n")
+
+    def test_dumps_many_as_csv_writer(self):
+        writer = io.StringIO()
+        result = Item.dumps_many_as_csv(iter([Item({"id": 1})]), writer=writer)
+
+        self.assertIsNone(result)
+        self.assertEqual(writer.getvalue(), '1,"none"\n')
+
+    def test_dumps_many_as_csv_empty(self):
+        self.assertEqual(Item.dumps_many_as_csv([]), "")
+        self.assertEqual(
+            Item.dumps_many_as_csv([], include_header=True), '"id","label"\n'
+        )
+        self.assertEqual(
+            Owner.dumps_many_as_csv(iter(()), include_header=True),
+            '"Name","item","items","tags"\n',
+        )
+        self.assertEqual(
+            Owner.dumps_many_as_csv([], raw=True, include_header=True),
+            '"name","item","items","tags","secret"\n',
+        )
+
+
+class TestJsonBytes(JsonBackendsMixin, unittest.TestCase):
+    def test_document(self):
+        owner = Owner({"Name": "été", "items": [{"id": 1}], "tags": [1.5, None]})
+
+        def check():
+            document = owner.dump_as_json_bytes()
+            self.assertIsInstance(document, bytes)
+            self.assertEqual(
+                document,
+                '{"Name":"été","item":{"id":null,"label":"none"},'
+                '"items":[{"id":1,"label":"none"}],"tags":[1.5,null]}'.encode(),
+            )
+            self.assertEqual(json.loads(document), json.loads(owner.dump_as_json()))
+            self.assertIn(b'"secret":"s"', owner.dump_as_json_bytes(raw=True))
+
+        self.check_both(check)
+
+    def test_loads_back(self):
+        owner = Owner({"Name": "été", "item": {"id": 1}, "items": [{"id": 2}]})
+
+        def check():
+            copied = Owner(owner.dump_as_json_bytes(raw=True))
+            self.assertEqual(copied.dumps(raw=True), owner.dumps(raw=True))
+
+        self.check_both(check)
+
+    def test_special_values(self):
+        key = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        class T(Typing2):
+            color = Field(default=Color.RED)
+            identifier = Field(default=key)
+            values = Field().list_of()
+
+        t = T({"values": [float("nan"), float("inf"), -float("inf"), 1.0]})
+
+        def check():
+            self.assertEqual(
+                t.dump_as_json_bytes(),
+                b'{"color":"red","identifier":"12345678-1234-5678-1234-567812345678",'
+                b'"values":[null,null,null,1.0]}',
+            )
+
+        self.check_both(check)
+
+    def test_unsupported_values(self):
+        class Number(int):
+            pass
+
+        class T(Typing2):
+            a = Field()
+
+        def check():
+            t = T({"a": datetime.datetime(2019, 1, 1)})
+            with self.assertRaises(TypeError):
+                t.dump_as_json_bytes()
+
+            t.a = Number(2)
+            self.assertEqual(t.dump_as_json_bytes(), b'{"a":2}')
+
+            t.a = 2**64
+            self.assertEqual(t.dump_as_json_bytes(), b'{"a":18446744073709551616}')
+
+        self.check_both(check)
+
+    def test_old_orjson(self):
+        # orjson before 3.1 has no passthrough options
+        old_orjson = types.ModuleType("orjson")
+        old_orjson.loads = json.loads
+        old_orjson.dumps = json.dumps
+        old_orjson.JSONDecodeError = json.JSONDecodeError
+
+        spec = importlib.util.spec_from_file_location(
+            "typing_engine._old_orjson_typing", typing_module.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {"orjson": old_orjson}):
+            spec.loader.exec_module(module)
+
+        self.assertIsNone(module.orjson)
+
+        class T(module.Typing2):
+            a = module.Field()
+
+        t = T(b'{"a": "\xc3\xa9t\xc3\xa9"}')
+        self.assertEqual(t.dump_as_json_bytes(), '{"a":"été"}'.encode())
+
+
+class TestListLoaders(unittest.TestCase):
+    def test_loads_custom_list(self):
+        class Tags(list):
+            pass
+
+        class T(Typing2):
+            tags = Field().list_of(str, instanciator=Tags)
+
+        t = T({"tags": [1, "b"]})
+        self.assertIsInstance(t.tags, Tags)
+        self.assertEqual(t.tags, ["1", "b"])
+
+
+class TestCopyOtherClass(unittest.TestCase):
+    def test_other_class(self):
+        class Other(Typing2):
+            id = Field()
+            other = Field(default="x")
+
+        item = Item({"id": 1, "label": "one"})
+        other = Other(item)
+        self.assertEqual(other.dumps(), {"id": 1, "other": "x"})
+
+
+class TestCompiledDumps(unittest.TestCase):
+    def test_dumps_hooks(self):
+        class T(Typing2):
+            a = Field(default=1)
+
+            def pre_dumps(self, raw):
+                self.a += 1
+
+            def post_dumps(self, raw, dump):
+                dump["raw"] = raw
+
+        t = T()
+        self.assertEqual(t.dumps(), {"a": 2, "raw": False})
+        self.assertEqual(t.dumps(raw=True), {"a": 3, "raw": True})
+
+    def test_compiled_dumps_reused(self):
+        class T(Typing2):
+            a = Field(default=1).converter(dumps=str)
+            b = Field(default=2)
+
+        t = T()
+        dumps_fn = t._Typing2__get_dispatch().get_dumps(False)
+        T.b.hide()
+        self.assertEqual(t.dumps(), {"a": "1"})
+        T.b.unhide()
+        self.assertEqual(t.dumps(), {"a": "1", "b": 2})
+        self.assertIs(t._Typing2__get_dispatch().get_dumps(False), dumps_fn)
+
+
+class TestDumpsAsCsv(unittest.TestCase):
+    def test_dumps_as_csv(self):
+        item = Item({"id": 1, "label": "one"})
+        self.assertEqual(item.dumps_as_csv(), '1,"one"\n')
+        self.assertEqual(
+            item.dumps_as_csv(include_header=True), '"id","label"\n1,"one"\n'
+        )
+
+
+class TestParent(unittest.TestCase):
+    def test_parent(self):
+        owner = Owner()
+        item = Item(parent=owner)
+        self.assertIs(item.parent, owner)
+        self.assertIsNone(Item().parent)
+        self.assertNotIn("parent", vars(Item()))
+
+    def test_owner_setattr(self):
+        names = []
+
+        class T(Typing2):
+            a = Field(default=1)
+
+            def __setattr__(self, name, value):
+                names.append(name)
+                super().__setattr__(name, value)
+
+        t = T({"a": 2})
+        self.assertEqual(names[0], "parent")
+        self.assertIsNone(t.parent)
+
+
+class TestLoadsManyFromBytes(JsonBackendsMixin, unittest.TestCase):
+    def test_loads(self):
+        data = '[{"id": 1, "label": "été"}, {"id": 2}, {}]'.encode()
+
+        def check():
+            items = Item.loads_many_from_bytes(data)
+            self.assertEqual(
+                [item.dumps() for item in items],
+                [
+                    {"id": 1, "label": "été"},
+                    {"id": 2, "label": "none"},
+                    {"id": None, "label": "none"},
+                ],
+            )
+            self.assertTrue(all(type(item) is Item for item in items))
+
+        self.check_both(check)
+
+    def test_nested(self):
+        owners = [Owner({"Name": "a", "items": [{"id": 1}]}), Owner({"Name": "b"})]
+        data = b"[%s]" % b",".join(o.dump_as_json_bytes(raw=True) for o in owners)
+
+        loaded = Owner.loads_many_from_bytes(data)
+        self.assertEqual(
+            [owner.dumps(raw=True) for owner in loaded],
+            [owner.dumps(raw=True) for owner in owners],
+        )
+        self.assertIs(loaded[0].items[0].parent, loaded[0])
+
+    def test_empty(self):
+        self.assertEqual(Item.loads_many_from_bytes(b"[]"), [])
+
+    def test_encoding(self):
+        data = '[{"label": "été"}]'.encode("latin-1")
+        items = Item.loads_many_from_bytes(data, encoding="latin-1")
+        self.assertEqual(items[0].label, "été")
+
+    def test_big_integer(self):
+        items = Item.loads_many_from_bytes(b'[{"id": 18446744073709551616}]')
+        self.assertEqual(items[0].id, 2**64)
+
+    def test_not_a_list(self):
+        with self.assertRaisesRegex(TypeError, "Expected a json array, got dict"):
+            Item.loads_many_from_bytes(b'{"id": 1}')
+
+    def test_item_not_an_object(self):
+        with self.assertRaisesRegex(
+            TypeError, "Expected a json object at position 1, got list"
+        ):
+            Item.loads_many_from_bytes(b'[{"id": 1}, [2]]')
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            Item.loads_many_from_bytes(b"[{")
+
+
+class CaseInsensitiveField(Field):
+    __slots__ = ()
+
+    def match(self, name):
+        return super().match(name.lower())
+
+
+class TestGetField(unittest.TestCase):
+    def test_get_field(self):
+        owner = Owner()
+        self.assertIs(owner.get_field("name"), Owner.name)
+        self.assertIs(owner.get_field("Name"), Owner.name)
+        self.assertIsNone(owner.get_field("unknown"))
+
+    def test_overridden_match(self):
+        class T(Typing2):
+            abc = CaseInsensitiveField()
+            other = Field()
+
+        t = T({"ABC": 1, "Other": 2})
+        self.assertIs(t.get_field("ABC"), T.abc)
+        self.assertIsNone(t.get_field("Other"))
+        self.assertEqual(t.abc, 1)
+        self.assertIsNone(t.other)
+        self.assertEqual(T(t).abc, 1)
@@ -18,10 +18,667 @@
 # along with python-typing-engine.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import sys
 import threading
 import io, csv, json
+import enum, math, operator, uuid
 from .errors import UnsupportedOperation
 
+try:
+    import orjson
+
+    # objects orjson would serialize but json does not are left to the fallback
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+except (ImportError, AttributeError):
+    # not installed or older than 3.1 (no passthrough options)
+    orjson = None
+
+
+def _json_default(obj):
+    """Encode objects that orjson supports natively and json does not
+
+    Args:
+        obj (object): an object not supported by the json module
+
+    Returns:
+        object: a json compatible value
+    """
+    if isinstance(obj, enum.Enum):
+        return obj.value
+
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+
+    raise TypeError(
+        "Object of type %s is not JSON serializable" % obj.__class__.__name__
+    )
+
+
+# compact utf-8 output like orjson.dumps() (see _json_dumps())
+_JSON_COMPACT_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_json_default
+)
+
+# orjson decodes integers out of the 64 bits range as float so documents
+# with a sequence of 19 digits or more are left to the json module
+_JSON_DIGITS = bytes(ord("0") if 0x30 <= i <= 0x39 else ord(" ") for i in range(256))
+_JSON_BIG_NUMBER = b"0" * 19
+
+
+def _json_loads(data, encoding, errors):
+    """Decode json bytes
+
+    orjson is used when available. The json module remains the reference
+    for inputs not supported by orjson (other encodings, NaN, big integers...)
+
+    Documents with a run of 19 digits or more are always decoded by the json
+    module, even when the digits are inside a string (eg: a long id), as they
+    may be an integer out of the 64 bits range that orjson decodes as a float.
+    The check costs a translated copy of data, about a fifth of the orjson
+    decoding time, while telling numbers from strings would cost more than
+    decoding with the json module.
+
+    Args:
+        data (bytes): a json document
+        encoding (str): encoding of data
+        errors (str): decoding errors handling
+
+    Returns:
+        object: the decoded document
+    """
+    if (
+        orjson is not None
+        and encoding.lower() in ("utf-8", "utf8")
+        and _JSON_BIG_NUMBER not in data.translate(_JSON_DIGITS)
+    ):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data.decode(encoding=encoding, errors=errors))
+
+
+def _json_finite(obj, containers=None):
+    """Replace non finite floats by None in lists, tuples and dicts
+
+    Args:
+        obj (object): an object to encode
+        containers (set): ids of the containers being replaced (circular references)
+
+    Returns:
+        object: obj or a copy without non finite floats
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+
+    if not isinstance(obj, (list, tuple, dict)):
+        return obj
+
+    if containers is None:
+        containers = set()
+
+    container = id(obj)
+    if container in containers:
+        # left to the encoder (circular reference error)
+        return obj
+
+    containers.add(container)
+    if isinstance(obj, dict):
+        obj = {
+            _json_finite(key, containers): _json_finite(value, containers)
+            for key, value in obj.items()
+        }
+    else:
+        obj = [_json_finite(item, containers) for item in obj]
+    containers.discard(container)
+
+    return obj
+
+
+def _json_dumps(obj):
+    """Encode as compact json bytes
+
+    orjson is used when available, the json module otherwise or for objects
+    not supported by orjson (non str keys, big integers, subclasses...).
+    Both produce the same document:
+
+    - no spaces and non ascii characters are not escaped
+    - NaN and infinite floats are null
+    - enums are their value and UUIDs their canonical string
+    - any other object (datetime, dataclass...) raises TypeError
+
+    Only the notation of floats with an exponent may differ (1e16 or 1e+16).
+
+    Args:
+        obj (object): an object to encode
+
+    Returns:
+        bytes: the utf-8 json document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+
+    try:
+        document = _JSON_COMPACT_ENCODER.encode(obj)
+    except ValueError:
+        # non finite floats (allow_nan=False)
+        document = _JSON_COMPACT_ENCODER.encode(_json_finite(obj))
+
+    return document.encode("utf-8")
+
+
+def _notify_change(method):
+    """Decorate a list method to notify a change on fields"""
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.revision += 1
+        Field.revision += 1
+        return result
+
+    return wrapper
+
+
+class _FieldList(list):
+    """List of fields
+
+    Any modification of the list is notified so dispatch tables
+    computed from it are rebuilt the next time they are used.
+    """
+
+    # incremented on every modification of this list
+    revision = 0
+
+    append = _notify_change(list.append)
+    extend = _notify_change(list.extend)
+    insert = _notify_change(list.insert)
+    remove = _notify_change(list.remove)
+    pop = _notify_change(list.pop)
+    clear = _notify_change(list.clear)
+    sort = _notify_change(list.sort)
+    reverse = _notify_change(list.reverse)
+    __setitem__ = _notify_change(list.__setitem__)
+    __delitem__ = _notify_change(list.__delitem__)
+    __iadd__ = _notify_change(list.__iadd__)
+
+
+def _invalidate_field(method):
+    """Decorate a list method to invalidate the field owning the list"""
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.field._invalidate()
+        self.field.notify_change()
+        return result
+
+    return wrapper
+
+
+class _FunctionList(list):
+    """List of setters or getters functions of a field
+
+    Any modification of the list invalidates the compiled getter and setter
+    of the field and is notified so dispatch tables are rebuilt.
+    """
+
+    __slots__ = ("field",)
+
+    def __init__(self, field, functions=()):
+        super().__init__(functions)
+        self.field = field
+
+    def __reduce__(self):
+        # functions are given to __init__() as the modified list methods
+        # need the field
+        return (type(self), (self.field, list(self)))
+
+    append = _invalidate_field(list.append)
+    extend = _invalidate_field(list.extend)
+    insert = _invalidate_field(list.insert)
+    remove = _invalidate_field(list.remove)
+    pop = _invalidate_field(list.pop)
+    clear = _invalidate_field(list.clear)
+    sort = _invalidate_field(list.sort)
+    reverse = _invalidate_field(list.reverse)
+    __setitem__ = _invalidate_field(list.__setitem__)
+    __delitem__ = _invalidate_field(list.__delitem__)
+    __iadd__ = _invalidate_field(list.__iadd__)
+
+
+# slots of Field holding compiled functions or the class they are compiled for
+_COMPILED_SLOTS = frozenset(("_get_fn", "_set_fn", "_owner", "_plain_owner"))
+
+
+def _field_option(attribute, compiled=False):
+    """Property of a field option stored in attribute
+
+    Setting the option is notified so dispatch tables are rebuilt.
+
+    Keyword Arguments:
+        compiled (bool): True - the option is used by the compiled getter and setter
+    """
+
+    def set_option(self, value):
+        setattr(self, attribute, value)
+        if compiled:
+            self._invalidate()
+        self.notify_change()
+
+    return property(operator.attrgetter(attribute), set_option)
+
+
+def _stores_in_dict(cls):
+    """Values of cls instances can be stored in their __dict__ directly
+
+    getattr(), setattr() and delattr() would do the same as cls doesn't
+    customize attribute access and its instances have a __dict__.
+
+    Args:
+        cls (class): a class
+
+    Returns:
+        bool: True - the __dict__ of instances can be used directly
+    """
+    return (
+        cls.__getattribute__ is object.__getattribute__
+        and cls.__setattr__ is object.__setattr__
+        and cls.__delattr__ is object.__delattr__
+        and getattr(cls, "__getattr__", None) is None
+        and cls.__dictoffset__ != 0
+    )
+
+
+# Converters returning the value itself when it already has the target type
+_IDENTITY_CONVERTERS = frozenset(
+    (bool, bytes, complex, float, frozenset, int, str, tuple)
+)
+
+
+def _is_identity_converter(converter):
+    """The converter returns a value of its own type unchanged
+
+    Args:
+        converter (class|function): a converter
+
+    Returns:
+        bool: True - conversion can be skipped for values of this type
+    """
+    return isinstance(converter, type) and converter in _IDENTITY_CONVERTERS
+
+
+def _intern(name):
+    """Intern a name
+
+    Interned names are compared by identity in dict lookups.
+
+    Args:
+        name (str): a name
+
+    Returns:
+        str: the interned name (other objects are returned as is)
+    """
+    if type(name) is str:
+        return sys.intern(name)
+
+    return name
+
+
+# Marker of an unset value
+_UNSET = object()
+
+
+def _compile_function(name, lines, namespace):
+    """Compile a function from source lines
+
+    Args:
+        name (str): name of the function defined by lines
+        lines (list): source code lines
+        namespace (dict): globals available to the function
+
+    Returns:
+        function: the compiled function
+    """
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+def _compile_dumps(plan):
+    """Compile the function building the dict of dumps() from a dumps plan
+
+    Each field of the plan is exported by straight-line code in the plan order.
+
+    Args:
+        plan (tuple): (dump name, field name, instance name, dumps converter,
+            converter only applied on values that are not None, is list)
+
+    Returns:
+        function: dumps(self, raw)
+    """
+    namespace = {"Typing2": Typing2, "UNSET": _UNSET}
+    lines = ["def dumps(self, raw):", "    values = self.__dict__"]
+    items = []
+
+    for i, row in enumerate(plan):
+        name, field_name, instance_name, convert, guarded, is_list = row
+        namespace["name_%d" % i] = name
+        namespace["field_name_%d" % i] = field_name
+        value = "value_%d" % i
+
+        if instance_name is None:
+            lines.append("    %s = getattr(self, field_name_%d, None)" % (value, i))
+        else:
+            # stored values are read directly
+            namespace["instance_name_%d" % i] = instance_name
+            lines += [
+                "    %s = values.get(instance_name_%d, UNSET)" % (value, i),
+                "    if %s is UNSET:" % value,
+                "        %s = getattr(self, field_name_%d, None)" % (value, i),
+            ]
+
+        if guarded:
+            # Field.dumps_convert() inlined with its converter
+            namespace["converter_%d" % i] = convert
+            if _is_identity_converter(convert):
+                lines.append(
+                    "    if %s is not None and type(%s) is not converter_%d:"
+                    % (value, value, i)
+                )
+            else:
+                lines.append("    if %s is not None:" % value)
+            lines.append("        %s = converter_%d(%s)" % (value, i, value))
+        elif convert is not None:
+            namespace["convert_%d" % i] = convert
+            lines.append("    %s = convert_%d(%s)" % (value, i, value))
+
+        # plain values are exposed as is
+        if is_list:
+            lines.append(
+                "    %s = [item.dumps(raw) if isinstance(item, Typing2) else item"
+                " for item in %s]" % (value, value)
+            )
+        else:
+            lines += [
+                "    if isinstance(%s, Typing2):" % value,
+                "        %s = %s.dumps(raw)" % (value, value),
+            ]
+
+        items.append("name_%d: %s" % (i, value))
+
+    lines.append("    return {%s}" % ", ".join(items))
+    return _compile_function("dumps", lines, namespace)
+
+
+def _is_plain_field(owner, field):
+    """The field is accessed as a plain Field attribute of owner instances
+
+    getattr() and setattr() would just call the compiled getter and setter
+    of the field so they can be called directly.
+
+    Args:
+        owner (class): the typing class
+        field (Field): a field of owner
+
+    Returns:
+        bool: True - the compiled getter and setter can be used directly
+    """
+    return (
+        type(field).__get__ is Field.__get__
+        and type(field).__set__ is Field.__set__
+        and owner.__getattribute__ is object.__getattribute__
+        and owner.__setattr__ is object.__setattr__
+        and owner.__dict__.get(field.name) is field
+    )
+
+
+class _Dispatch:
+    """Dispatch tables of a typing class
+
+    Computed once from the fields list and reused by loads and dumps
+    as long as no field of the list (or the list itself) is modified.
+
+    Compiled functions are kept from the previous tables of the class when
+    they are still up to date (eg: after hide() then unhide()).
+
+    Changes of a plain list of fields (not a _FieldList) are not notified
+    so tables computed from it are rebuilt on every use.
+
+    Args:
+        owner (class): the typing class
+        fields (list): List of Field
+        compile_loader (function): compile the loader of a field
+        previous (_Dispatch): previous tables of the class or None
+    """
+
+    # maximum number of compiled dumps functions kept for a class
+    MAX_COMPILED_DUMPS = 8
+
+    def __init__(self, owner, fields, compile_loader, previous=None):
+        # snapshot first so a concurrent change makes this table outdated
+        self.revision = Field.revision
+        self.fields = fields
+        # None for a plain list: its changes are unknown (see is_valid())
+        self.fields_revision = getattr(fields, "revision", None)
+        self.field_revisions = tuple(field._revision for field in fields)
+
+        if previous is None:
+            # field to (field revision, loader) and dumps plan key to function
+            self.compiled_loaders = dict()
+            self.compiled_dumps = dict()
+        else:
+            self.compiled_loaders = previous.compiled_loaders
+            self.compiled_dumps = previous.compiled_dumps
+
+        # name and mapping name to field (first defined field wins like match())
+        self.index = dict()
+        for field in fields:
+            self.index.setdefault(field.name, field)
+            if field.mapping_name:
+                self.index.setdefault(field.mapping_name, field)
+
+        # functions are compiled on first use (see get_loaders() and get_dumps())
+        self.compile_loader = compile_loader
+        self.loaders = None
+        self.dumps_fn = None
+        self.dumps_raw_fn = None
+
+        # instance names of values that can be read without the descriptor
+        stored = {
+            field: field.instance_name
+            for field in fields
+            if not field.getters_funcs and _is_plain_field(owner, field)
+        }
+
+        # dumps plans: (dump name, field name, instance name, dumps converter,
+        # converter only applied on values that are not None, is list)
+        self.dumps_raw = tuple(
+            (field.name, field.name, stored.get(field), None, False, field.is_list)
+            for field in fields
+        )
+        self.dumps = tuple(
+            (field.get_name(), field.name, stored.get(field))
+            + self.__dumps_converter(field)
+            + (field.is_list,)
+            for field in fields
+            if not field.hidden
+        )
+
+        # overridden get_field() and get_fields() are called instead of the tables
+        # and names are matched by match() if a field overrides it (see index)
+        self.custom_match = any(
+            type(field).match is not Field.match for field in fields
+        )
+        self.custom_get_field = (
+            owner.get_field is not Typing2.get_field or self.custom_match
+        )
+        self.custom_get_fields = owner.get_fields is not Typing2.get_fields
+
+        # values to remove on reset (fields with a custom deleter are called)
+        if _stores_in_dict(owner):
+            self.instance_names = tuple(
+                field.instance_name
+                for field in fields
+                if type(field).__delete__ is Field.__delete__
+            )
+            self.deleters = tuple(
+                field
+                for field in fields
+                if type(field).__delete__ is not Field.__delete__
+            )
+        else:
+            self.instance_names = ()
+            self.deleters = tuple(fields)
+
+    @staticmethod
+    def __dumps_converter(field):
+        """Get the dumps converter of a field for a dumps plan
+
+        Field.dumps_convert() is replaced by the converter itself so the
+        plan changes (and is compiled again) with the converter.
+
+        Args:
+            field (Field): a field
+
+        Returns:
+            tuple: (dumps converter, converter only applied on values that are not None)
+        """
+        convert = field.get_dumps_convert()
+
+        if getattr(convert, "__func__", None) is Field.dumps_convert:
+            return field.dumps_converter, True
+
+        return convert, False
+
+    def get_loader(self, field):
+        """Get the compiled loader of a field
+
+        Args:
+            field (Field): a field
+
+        Returns:
+            function: load(self, value)
+        """
+        revision = field._revision
+        compiled = self.compiled_loaders.get(field)
+
+        if compiled is None or compiled[0] != revision:
+            compiled = (revision, self.compile_loader(field))
+            self.compiled_loaders[field] = compiled
+
+        return compiled[1]
+
+    @staticmethod
+    def __converter_key(convert):
+        """Get the key of a dumps converter in the key of a dumps plan
+
+        Args:
+            convert (function): a dumps converter or None
+
+        Returns:
+            object: the converter if hashable, its id otherwise
+        """
+        try:
+            hash(convert)
+        except TypeError:
+            # eg: a dataclass instance, the compiled function keeps the
+            # converter alive so its id is not reused
+            return id(convert)
+
+        return convert
+
+    def __get_compiled_dumps(self, plan):
+        """Get the compiled dumps function of a plan
+
+        Args:
+            plan (tuple): a dumps plan
+
+        Returns:
+            function: dumps(self, raw)
+        """
+        converter_key = self.__converter_key
+        key = tuple(
+            (name, field_name, instance_name, converter_key(convert), guarded, is_list)
+            for name, field_name, instance_name, convert, guarded, is_list in plan
+        )
+        compiled_dumps = self.compiled_dumps
+        dumps_fn = compiled_dumps.get(key)
+
+        if dumps_fn is None:
+            if len(compiled_dumps) >= self.MAX_COMPILED_DUMPS:
+                compiled_dumps.clear()
+            dumps_fn = compiled_dumps[key] = _compile_dumps(plan)
+
+        return dumps_fn
+
+    def get_loaders(self):
+        """Get the functions loading a value in a field
+
+        Compiled on first use only so a change that concerns dumps (eg: hide())
+        doesn't recompile them all.
+
+        Returns:
+            dict: name and mapping name to load(self, value)
+        """
+        loaders = self.loaders
+
+        if loaders is None:
+            loaders = {
+                name: self.get_loader(field) for name, field in self.index.items()
+            }
+            self.loaders = loaders
+
+        return loaders
+
+    def get_dumps(self, raw):
+        """Get the function building the dict of dumps()
+
+        Args:
+            raw (bool): True - to expose a raw object
+
+        Returns:
+            function: dumps(self, raw)
+        """
+        if raw:
+            if self.dumps_raw_fn is None:
+                self.dumps_raw_fn = self.__get_compiled_dumps(self.dumps_raw)
+            return self.dumps_raw_fn
+
+        if self.dumps_fn is None:
+            self.dumps_fn = self.__get_compiled_dumps(self.dumps)
+        return self.dumps_fn
+
+    def is_valid(self, fields):
+        """This dispatch table is still valid for fields
+
+        Args:
+            fields (list): List of Field
+
+        Returns:
+            bool: True - valid, False - need to be rebuilt
+        """
+        if self.fields is not fields or self.fields_revision is None:
+            return False
+
+        revision = Field.revision
+        if self.revision == revision:
+            return True
+
+        # a field has been modified: only the fields of this list are concerned
+        if self.fields_revision != fields.revision or self.field_revisions != tuple(
+            field._revision for field in fields
+        ):
+            return False
+
+        self.revision = revision
+        return True
+
 
 class Typing2:
     """Typing class version 2
@@ -33,10 +690,22 @@ class Typing2:
     """
 
     __init_lock = threading.Lock()
+    __dispatch = None
+
+    # parent of the object (set on instances only when there is one, or when
+    # the class customizes __setattr__ which expects to see every assignment)
+    parent = None
+    __set_parent = False
 
     def __init__(self, data=None, parent=None):
-        self.parent = parent
-        self.__one_time_init()
+        # same first attempt as __one_time_init() without calling it
+        if "_Typing2__init_done" not in type(self).__dict__:
+            self.__one_time_init()
+
+        # the class default is used without parent
+        if parent is not None or self.__set_parent:
+            self.parent = parent
+
         self.post_init()
 
         if data is None:
@@ -82,7 +751,12 @@ class Typing2:
             if top_cls.__dict__.get("_Typing2__init_done", False):
                 return
 
-            top_cls.__fields = []
+            top_cls.__fields = _FieldList()
+
+            # names and mapping names already defined (same as get_field())
+            known_names = set()
+            # get_field() is called instead if it or match() is overridden
+            lookup = top_cls.get_field is not Typing2.get_field
 
             for cls in self.__class__.__mro__[:-1]:
                 for name, field in cls.__dict__.items():
@@ -90,14 +764,29 @@ class Typing2:
                         if cls == top_cls:
                             field.set_name(name)
                             top_cls.__fields.append(field)
-                        elif self.get_field(name) is None:
-                            copied_field = field.copy()
-                            copied_field.set_name(name)
-                            top_cls.__fields.append(copied_field)
-                            setattr(top_cls, name, copied_field)
+                        elif (
+                            self.get_field(name) is None
+                            if lookup
+                            else name not in known_names
+                        ):
+                            field = field.copy()
+                            field.set_name(name)
+                            top_cls.__fields.append(field)
+                            setattr(top_cls, name, field)
+                        else:
+                            continue
+
+                        known_names.add(field.name)
+                        if field.mapping_name:
+                            known_names.add(field.mapping_name)
+                        if type(field).match is not Field.match:
+                            lookup = True
 
             self.transform_fields()
 
+            # a customized __setattr__ sees the parent even when it is None
+            top_cls.__set_parent = top_cls.__setattr__ is not object.__setattr__
+
             # init done
             top_cls.__init_done = True
 
@@ -115,16 +804,39 @@ class Typing2:
             object: A value
         """
         if is_list:
-            values = []
-            for i in value:
-                # list of list is not supported so is_list need to be set to False
-                values.append(self.__dump(i, raw, False))
-            return values
+            # list of list is not supported so items are not lists
+            return [
+                item.dumps(raw) if isinstance(item, Typing2) else item for item in value
+            ]
         elif isinstance(value, Typing2):
             return value.dumps(raw)
         else:
             return value
 
+    def __get_dispatch(self):
+        """Get the dispatch tables of the class
+
+        Tables are rebuilt only if a field has been modified since
+        the last call.
+
+        Returns:
+            _Dispatch: dispatch tables
+        """
+        cls = type(self)
+        dispatch = cls.__dispatch
+
+        if dispatch is None or not dispatch.is_valid(cls.__fields):
+            # compiled functions are only reused from tables of this class
+            dispatch = _Dispatch(
+                cls,
+                cls.__fields,
+                cls.__compile_loader,
+                cls.__dict__.get("_Typing2__dispatch"),
+            )
+            cls.__dispatch = dispatch
+
+        return dispatch
+
     @classmethod
     def transform_fields(cls):
         """Transform fields
@@ -143,11 +855,16 @@ class Typing2:
         Arg:
             name (str): name of a field (can be the mapping name too)
         """
-        for field in self.__fields:
-            if field.match(name):
-                return field
+        dispatch = self.__get_dispatch()
+
+        if dispatch.custom_match:
+            for field in self.__fields:
+                if field.match(name):
+                    return field
 
-        return None
+            return None
+
+        return dispatch.index.get(name)
 
     def get_fields(self):
         """Get all fields
@@ -159,7 +876,18 @@ class Typing2:
 
     def reset(self):
         """Reinitialize an object based on its definition"""
-        for field in self.get_fields():
+        dispatch = self.__get_dispatch()
+
+        if dispatch.custom_get_fields:
+            for field in self.get_fields():
+                field.__delete__(self)
+            return
+
+        values = self.__dict__
+        for instance_name in dispatch.instance_names:
+            values.pop(instance_name, None)
+
+        for field in dispatch.deleters:
             field.__delete__(self)
 
     def loads_from_typing(self, other):
@@ -172,6 +900,21 @@ class Typing2:
         # by loads_from_dict
         self.loads_from_dict(other.dumps(raw=True))
 
+    @staticmethod
+    def __extend(variable, items):
+        """Append items to a list or equivalent
+
+        Args:
+            variable (object): a list or any object with an append() method
+            items (list): items to append
+        """
+        if isinstance(variable, list):
+            variable.extend(items)
+        else:
+            append = variable.append
+            for item in items:
+                append(item)
+
     def pre_loads(self, data):
         """called before loads()
 
@@ -193,26 +936,99 @@ class Typing2:
             return
 
         preload_data = self.pre_loads(data)
+        dispatch = self.__get_dispatch()
 
-        for name, value in preload_data.items():
-            field = self.get_field(name)
+        if dispatch.custom_get_field:
+            get_loader = dispatch.get_loader
 
-            if field is None:
-                continue
+            for name, value in preload_data.items():
+                field = self.get_field(name)
 
-            variable = getattr(self, field.name)
+                if field is not None:
+                    get_loader(field)(self, value)
+        else:
+            loaders = dispatch.loaders or dispatch.get_loaders()
 
-            if isinstance(variable, Typing2):
-                variable.loads_from_dict(value)
-            elif field.is_list:
-                # we assume that value is enumerable as we need to store it on a list or equivalent
-                for subset_data in value:
-                    variable.append(field.get_inside_instance(subset_data, self))
-            else:
-                setattr(self, field.name, value)
+            for name, value in preload_data.items():
+                loader = loaders.get(name)
+
+                if loader is not None:
+                    loader(self, value)
 
         self.post_loads()
 
+    @classmethod
+    def __compile_loader(cls, field):
+        """Compile the function loading a value in a field
+
+        The loaded value is:
+        - merged if the current value is a typing object
+        - appended if the field is a list
+        - set otherwise
+
+        A Field accessed normally goes through its compiled getter and setter
+        directly. Any other field uses getattr() and setattr().
+
+        Args:
+            field (Field): a field of the class
+
+        Returns:
+            function: load(self, value)
+        """
+        namespace = {
+            "field": field,
+            "field_name": field.name,
+            "instance_name": field.instance_name,
+            "Typing2": Typing2,
+            "extend": cls.__extend,
+            "UNSET": _UNSET,
+        }
+
+        direct = _is_plain_field(cls, field)
+
+        lines = ["def load(self, value):"]
+        if not direct:
+            lines.append("    variable = getattr(self, field_name)")
+        elif field.getters_funcs:
+            lines.append("    variable = field._get_fn(self)")
+        else:
+            lines += [
+                "    variable = self.__dict__.get(instance_name, UNSET)",
+                "    if variable is UNSET:",
+                "        variable = field._get_fn(self)",
+            ]
+
+        lines += [
+            "    if isinstance(variable, Typing2):",
+            "        variable.loads_from_dict(value)",
+            "    else:",
+        ]
+        if field.is_list:
+            # we assume that value is enumerable as we need to store it on a list or equivalent
+            if field.is_typing_list():
+                namespace["inside_instanciator"] = field.inside_instanciator
+                items = "[inside_instanciator(item, parent=self) for item in value]"
+                items_list = items
+            elif field.inside_instanciator is None and field.is_plain_list():
+                items = "value"
+                items_list = "list(value)"
+            else:
+                items = "field.get_inside_instances(value, self)"
+                items_list = items
+
+            lines += [
+                "        if type(variable) is list:",
+                "            variable.extend(%s)" % items,
+                "        else:",
+                "            extend(variable, %s)" % items_list,
+            ]
+        elif direct:
+            lines.append("        field._set_fn(self, value)")
+        else:
+            lines.append("        setattr(self, field_name, value)")
+
+        return _compile_function("load", lines, namespace)
+
     def post_loads(self):
         """called after loads()"""
         pass
@@ -237,6 +1053,27 @@ class Typing2:
 
         self.pre_dumps(raw)
 
+        dispatch = self.__get_dispatch()
+        if dispatch.custom_get_fields:
+            dump = self.__dumps_fields(raw)
+        else:
+            dump = dispatch.get_dumps(raw)(self, raw)
+
+        self.post_dumps(raw, dump)
+
+        return dump
+
+    def __dumps_fields(self, raw):
+        """Export the fields returned by get_fields() as a dict
+
+        Used instead of the compiled dumps when get_fields() is overridden.
+
+        Args:
+            raw (bool): True - to expose a raw object
+
+        Returns:
+            dict: A dictionary of exposed fields
+        """
         dump = dict()
         for field in self.get_fields():
 
@@ -252,8 +1089,6 @@ class Typing2:
                 value, raw, field.is_list
             )
 
-        self.post_dumps(raw, dump)
-
         return dump
 
     def post_dumps(self, raw, dump):
@@ -286,13 +1121,62 @@ class Typing2:
         if return_csv:
             writer = io.StringIO()
 
+        # columns are the keys of the dump (same output as a csv.DictWriter)
         dump = self.dumps(raw=raw)
-        csv_writer = csv.DictWriter(
-            writer, dump.keys(), dialect=dialect, quoting=csv.QUOTE_NONNUMERIC
-        )
+        csv_writer = csv.writer(writer, dialect=dialect, quoting=csv.QUOTE_NONNUMERIC)
         if include_header:
-            csv_writer.writeheader()
-        csv_writer.writerow(dump)
+            csv_writer.writerow(dump.keys())
+        csv_writer.writerow(dump.values())
+
+        if return_csv:
+            writer.flush()
+            return writer.getvalue()
+
+    @classmethod
+    def dumps_many_as_csv(
+        cls, instances, raw=False, include_header=False, writer=None, dialect="unix"
+    ):
+        """Export many objects as a CSV
+
+        Same as dumps_as_csv() for each object but the csv writer is created
+        only once. Columns are the fields of the first object, or of a new
+        cls object to export the header when there are no objects.
+
+        Args:
+            instances (iterable): typing objects
+
+        Keyword Arguments:
+            raw (bool): True - to expose a raw dumps
+            include_header (bool): True - export the header, False - export data only
+            writer (object): any object with a write() method
+            dialect (str): unix|excel|excel-tab
+
+        Returns:
+            str: the csv content only if writer is not set
+        """
+        return_csv = writer is None
+
+        if return_csv:
+            writer = io.StringIO()
+
+        csv_writer = None
+        for instance in instances:
+            dump = instance.dumps(raw=raw)
+
+            if csv_writer is None:
+                csv_writer = csv.DictWriter(
+                    writer, dump.keys(), dialect=dialect, quoting=csv.QUOTE_NONNUMERIC
+                )
+                if include_header:
+                    csv_writer.writeheader()
+
+            csv_writer.writerow(dump)
+
+        if csv_writer is None and include_header:
+            csv_writer = csv.writer(
+                writer, dialect=dialect, quoting=csv.QUOTE_NONNUMERIC
+            )
+            csv_writer.writerow(cls().dumps(raw=raw).keys())
 
         if return_csv:
             writer.flush()
@@ -309,6 +1193,23 @@ class Typing2:
         """
         return json.dumps(self.dumps(raw=raw))
 
+    def dump_as_json_bytes(self, raw=False):
+        """Export as a compact utf-8 json
+
+        Faster than dump_as_json() and can be read back with loads_from_bytes().
+        The document is the same with or without orjson installed: no spaces,
+        non ascii characters not escaped, NaN and infinite floats as null,
+        enums as their value, UUIDs as strings and TypeError for other objects
+        (eg: datetime). Only floats with an exponent may be written 1e16 or 1e+16.
+
+        Keyword Arguments:
+            raw (bool): True - to expose a raw dumps
+
+        Returns:
+            bytes: the json content
+        """
+        return _json_dumps(self.dumps(raw=raw))
+
     def encode(self, encoding="utf-8", errors="strict"):
         """Encode as bytes
 
@@ -323,7 +1224,39 @@ class Typing2:
         Args:
             data (bytes): a bytes representation
         """
-        self.loads_from_dict(json.loads(data.decode(encoding=encoding, errors=errors)))
+        self.loads_from_dict(_json_loads(data, encoding, errors))
+
+    @classmethod
+    def loads_many_from_bytes(cls, data, encoding="utf-8", errors="strict"):
+        """Decode bytes of a json array to typing objects
+
+        The whole document is decoded once then each item is loaded like
+        cls(item).
+
+        Args:
+            data (bytes): a bytes representation of a list of objects
+
+        Returns:
+            list: typing objects
+
+        Raises:
+            TypeError: the document is not a list or an item is not an object
+        """
+        items = _json_loads(data, encoding, errors)
+
+        if not isinstance(items, list):
+            raise TypeError("Expected a json array, got %s" % type(items).__name__)
+
+        instances = []
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise TypeError(
+                    "Expected a json object at position %d, got %s"
+                    % (position, type(item).__name__)
+                )
+            instances.append(cls(item))
+
+        return instances
 
     def __repr__(self):
         return str(self)
@@ -343,75 +1276,351 @@ class Field:
         default (object): a default value for the field
     """
 
+    __slots__ = (
+        "_name",
+        "_instanciator",
+        "default_value",
+        "_inside_instanciator",
+        "_is_list",
+        "_hidden",
+        "_mapping_name",
+        "_dumps_converter",
+        "_loads_converter",
+        "_instance_name",
+        "_setters_funcs",
+        "_getters_funcs",
+        "_get_fn",
+        "_set_fn",
+        "_match_set",
+        "_raw_name",
+        "_pretty_name",
+        "_revision",
+        "_owner",
+        "_plain_owner",
+    )
+
+    # incremented on every configuration change of any field
+    revision = 0
+
     def __init__(self, name=None, instanciator=None, default=None):
         # from variables
-        self.name = None
-        self.instanciator = instanciator
+        self._name = None
+        self._instanciator = instanciator
         self.default_value = default
 
         # internal
-        self.inside_instanciator = None
-        self.is_list = False
-        self.hidden = False
-        self.mapping_name = None
-        self.dumps_converter = None
-        self.loads_converter = None
-        self.instance_name = None
-        self.setters_funcs = list()
-        self.getters_funcs = list()
+        self._inside_instanciator = None
+        self._is_list = False
+        self._hidden = False
+        self._mapping_name = None
+        self._dumps_converter = None
+        self._loads_converter = None
+        self._instance_name = None
+        self._setters_funcs = _FunctionList(self)
+        self._getters_funcs = _FunctionList(self)
+        self._get_fn = None
+        self._set_fn = None
+        # incremented on every configuration change of this field
+        self._revision = 0
+        # class whose instances values are stored in __dict__ by the compiled
+        # getter and setter (see _compile())
+        self._owner = None
+        # same for a field without getters whose stored values are returned
+        # by __get__() directly
+        self._plain_owner = None
+
+        self.set_name(name)
 
+    # options: setting them directly is the same as using the methods below
+    instanciator = _field_option("_instanciator", compiled=True)
+    inside_instanciator = _field_option("_inside_instanciator")
+    is_list = _field_option("_is_list")
+    hidden = _field_option("_hidden")
+    dumps_converter = _field_option("_dumps_converter")
+    loads_converter = _field_option("_loads_converter", compiled=True)
+    instance_name = _field_option("_instance_name", compiled=True)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
         self.set_name(name)
 
+    @property
+    def mapping_name(self):
+        return self._mapping_name
+
+    @mapping_name.setter
+    def mapping_name(self, mapping_name):
+        self._mapping_name = mapping_name
+        self.__update_names()
+        self.notify_change()
+
+    @property
+    def setters_funcs(self):
+        return self._setters_funcs
+
+    @setters_funcs.setter
+    def setters_funcs(self, functions):
+        self._setters_funcs = _FunctionList(self, functions)
+        self._invalidate()
+        self.notify_change()
+
+    @property
+    def getters_funcs(self):
+        return self._getters_funcs
+
+    @getters_funcs.setter
+    def getters_funcs(self, functions):
+        self._getters_funcs = _FunctionList(self, functions)
+        self._invalidate()
+        self.notify_change()
+
+    def notify_change(self):
+        """Notify a configuration change
+
+        Dispatch tables computed from this field will be rebuilt.
+        """
+        self._revision += 1
+        Field.revision += 1
+
+    def _invalidate(self):
+        """Compile the getter and setter functions on their next use
+
+        They are compiled for the class of the instance that is accessed
+        first (see _compile()).
+        """
+        self._get_fn = self.__compile_and_get
+        self._set_fn = self.__compile_and_set
+        self._plain_owner = None
+
+    def __compile_and_get(self, instance):
+        """Compile and call the getter function"""
+        self._compile(type(instance))
+        return self._get_fn(instance)
+
+    def __compile_and_set(self, instance, value):
+        """Compile and call the setter function"""
+        self._compile(type(instance))
+        self._set_fn(instance, value)
+
+    def __stores_in_dict(self, instance):
+        """The value of instance can be stored in its __dict__ directly"""
+        owner = type(instance)
+        return owner is self._owner or _stores_in_dict(owner)
+
+    def _compile(self, owner):
+        """Compile the getter and setter functions
+
+        The converter, setters and getters chains are known at configuration
+        time so they are generated as straight-line code instead of being
+        interpreted on every attribute access.
+
+        Values of owner instances are stored in their __dict__ directly unless
+        owner customizes attribute access. Other objects (eg: instances of
+        another class, with __slots__...) use getattr() and setattr().
+
+        Args:
+            owner (class): the class of the instance that is accessed
+        """
+        if not _stores_in_dict(owner):
+            owner = None
+        self._owner = owner
+        self._plain_owner = None if self.getters_funcs else owner
+
+        namespace = {
+            "field": self,
+            "instance_name": self.instance_name,
+            "init_value": self.__init_value,
+            "owner": owner,
+            "UNSET": _UNSET,
+        }
+        setters = self._compile_setters(namespace)
+
+        # getter
+        lines = ["def get(instance):"]
+        indent = "    "
+        if owner is not None:
+            lines += [
+                "    if type(instance) is owner:",
+                "        values = instance.__dict__",
+                "        value = values.get(instance_name, UNSET)",
+                "        if value is UNSET:",
+                "            " + self.__init_statement(setters),
+                "    else:",
+            ]
+            indent = "        "
+        lines += [
+            indent + "value = getattr(instance, instance_name, UNSET)",
+            indent + "if value is UNSET:",
+            indent + "    return init_value(instance)",
+        ]
+        lines += self._compile_getters(namespace)
+        lines.append("    return value")
+        self._get_fn = _compile_function("get", lines, namespace)
+
+        # setter
+        lines = ["def set(instance, value):"]
+        lines += setters
+        if owner is not None:
+            lines += [
+                "    if type(instance) is owner:",
+                "        instance.__dict__[instance_name] = value",
+                "        return",
+            ]
+        lines.append("    setattr(instance, instance_name, value)")
+        self._set_fn = _compile_function("set", lines, namespace)
+
+    def __init_statement(self, setters):
+        """Source statement initializing an unset value stored in values
+
+        Args:
+            setters (list): source lines of the setter (see _compile_setters())
+
+        Returns:
+            str: source code statement
+        """
+        plain_init = (
+            not setters
+            and type(self).__set__ is Field.__set__
+            and type(self).get_instance is Field.get_instance
+        )
+        if plain_init and self.instanciator is None:
+            # the default value is stored as is (nothing can loop on the field)
+            return "value = values[instance_name] = field.default_value"
+
+        if (
+            plain_init
+            and isinstance(self.instanciator, type)
+            and not issubclass(self.instanciator, Typing2)
+        ):
+            # same for a new container (eg: list) as the instance is not given
+            return "value = values[instance_name] = field.instanciator()"
+
+        return "return init_value(instance)"
+
+    def _compile_getters(self, namespace):
+        """Source lines applying getters on value
+
+        Args:
+            namespace (dict): globals of the compiled function
+
+        Returns:
+            list: source code lines
+        """
+        return [
+            self.__compile_call(namespace, "getter_%d" % i, func)
+            for i, func in enumerate(self.getters_funcs)
+        ]
+
+    def _compile_setters(self, namespace):
+        """Source lines applying the loads converter and setters on value
+
+        Args:
+            namespace (dict): globals of the compiled function
+
+        Returns:
+            list: source code lines
+        """
+        lines = []
+
+        if type(self).loads_convert is not Field.loads_convert:
+            namespace["loads_convert"] = self.loads_convert
+            lines.append("    value = loads_convert(value)")
+        elif self.loads_converter is not None:
+            namespace["loads_converter"] = self.loads_converter
+            if _is_identity_converter(self.loads_converter):
+                lines.append(
+                    "    if value is not None and type(value) is not loads_converter:"
+                )
+            else:
+                lines.append("    if value is not None:")
+            lines.append("        value = loads_converter(value)")
+
+        for i, func in enumerate(self.setters_funcs):
+            lines.append(self.__compile_call(namespace, "setter_%d" % i, func))
+
+        return lines
+
+    @staticmethod
+    def __compile_call(namespace, name, func):
+        """Source line calling a setter or getter function
+
+        Args:
+            namespace (dict): globals of the compiled function
+            name (str): name to bind the function to
+            func (function): a setter or getter function
+
+        Returns:
+            str: source code line
+        """
+        namespace[name] = func
+
+        if type(func).__name__ == "method":
+            # dynamic
+            return "    value = %s(value)" % name
+
+        # static
+        return "    value = %s(instance, value)" % name
+
+    def __init_value(self, instance):
+        """Initialize the value of an instance and return it"""
+
+        # Set a temporary value without using setters
+        # only because a setter can request a getattr on the field that
+        # we are currently trying to set (avoid loop)
+        self.__store(instance, None)
+
+        # we can use setter safely without loop risk
+        self.__set__(instance, self.get_instance(instance))
+
+        # Call itself to return value and used getters as expected
+        return self._get_fn(instance)
+
+    def __store(self, instance, value):
+        """Store a value on an instance without setters
+
+        Args:
+            instance (object): an object
+            value (object): the value to store
+        """
+        if self.__stores_in_dict(instance):
+            instance.__dict__[self._instance_name] = value
+        else:
+            setattr(instance, self._instance_name, value)
+
     def __get__(self, instance, owner):
         """Getter"""
         if instance is None:
             return self
 
-        try:
-            value = getattr(instance, self.instance_name)
-        except AttributeError:
-            # Set a temporary value without using setters
-            # only because a setter can request a getattr on the field that
-            # we are currently trying to set (avoid loop)
-            setattr(instance, self.instance_name, None)
-
-            # we can use setter safely without loop risk
-            self.__set__(instance, self.get_instance(instance))
-
-            # Call itself to return value and used getters as expected
-            return self.__get__(instance, owner)
-
-        # getters
-        for func in self.getters_funcs:
-            if type(func).__name__ == "method":
-                # dynamic
-                value = func(value)
-            else:
-                # static
-                value = func(instance, value)
+        # stored value without getters: no need to call the compiled getter
+        # (a value is missing only until its first access)
+        if type(instance) is self._plain_owner:
+            try:
+                return instance.__dict__[self._instance_name]
+            except KeyError:
+                pass
 
-        return value
+        return self._get_fn(instance)
 
     def __set__(self, instance, value):
         """Setter
 
         Can convert value if loads converter is set.
         """
-        value = self.loads_convert(value)
-        for func in self.setters_funcs:
-            if type(func).__name__ == "method":
-                # dynamic
-                value = func(value)
-            else:
-                # static
-                value = func(instance, value)
-
-        setattr(instance, self.instance_name, value)
+        self._set_fn(instance, value)
 
     def __delete__(self, instance):
         """Deleter"""
+        if self.__stores_in_dict(instance):
+            instance.__dict__.pop(self._instance_name, None)
+            return
+
         try:
-            delattr(instance, self.instance_name)
+            delattr(instance, self._instance_name)
         except AttributeError:
             pass
 
@@ -427,7 +1636,7 @@ class Field:
         """
         if not bypass_converter:
             value = self.loads_convert(value)
-        setattr(instance, self.instance_name, value)
+        self.__store(instance, value)
 
     def direct_get(self, instance):
         """Get the value directly
@@ -438,7 +1647,17 @@ class Field:
         Returns:
             object: the value
         """
-        return getattr(instance, self.instance_name)
+        if not self.__stores_in_dict(instance):
+            # eg: no __dict__ (__slots__) or custom attribute access
+            return getattr(instance, self._instance_name)
+
+        value = instance.__dict__.get(self._instance_name, _UNSET)
+
+        if value is _UNSET:
+            # same error as getattr()
+            return getattr(instance, self._instance_name)
+
+        return value
 
     def copy(self):
         """Create a copy of this field
@@ -448,35 +1667,73 @@ class Field:
         """
         field = type(self)()
 
-        field.name = self.name
         field.instanciator = self.instanciator
         field.inside_instanciator = self.inside_instanciator
         field.is_list = self.is_list
         field.default_value = self.default_value
         field.hidden = self.hidden
-        field.mapping_name = self.mapping_name
         field.dumps_converter = self.dumps_converter
         field.loads_converter = self.loads_converter
-        field.instance_name = self.instance_name
-        for func in self.setters_funcs:
-            field.setters(func)
-        for func in self.getters_funcs:
-            field.getters(func)
+        field.setters_funcs = list(self.setters_funcs)
+        # same order as registering each getter again with getters()
+        field.getters_funcs = self.getters_funcs[::-1]
+        field.mapping(self.mapping_name)
+
+        field.set_name(self.name)
 
         return field
 
+    def __getstate__(self):
+        """Get the state of the field (pickle)
+
+        Compiled functions and the class they are compiled for are left out.
+        """
+        state = dict(getattr(self, "__dict__", ()))
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot not in _COMPILED_SLOTS and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the field (pickle)
+
+        Getter and setter functions are compiled again on their next use.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._owner = None
+        self._invalidate()
+
     def set_name(self, name):
         """Set the name and instance name
 
         Args:
             name (str): name of the field
         """
-        self.name = name
+        self._name = _intern(name)
 
         if name:
-            self.instance_name = "_" + name
+            self._instance_name = _intern("_" + name)
         else:
-            self.instance_name = None
+            self._instance_name = None
+
+        self.__update_names()
+        self._invalidate()
+        self.notify_change()
+
+    def __update_names(self):
+        """Update names returned by get_name() and matched by match()"""
+        if self.mapping_name:
+            self._match_set = frozenset((self.name, self.mapping_name))
+        else:
+            self._match_set = frozenset((self.name,))
+
+        self._raw_name = self.name
+        if self.mapping_name is not None:
+            self._pretty_name = self.mapping_name
+        else:
+            self._pretty_name = self.name
 
     def get_name(self, no_mapping=False):
         """Get the name or mapping name
@@ -484,10 +1741,7 @@ class Field:
         Keyword Arguments:
             no_mapping (bool): False - Prefer the mapping name
         """
-        if not no_mapping and self.mapping_name is not None:
-            return self.mapping_name
-
-        return self.name
+        return self._raw_name if no_mapping else self._pretty_name
 
     def setters(self, function=None, clear=False):
         """add a new setter function
@@ -532,7 +1786,7 @@ class Field:
         Returns:
             Field: self
         """
-        self.mapping_name = mapping_name
+        self.mapping_name = _intern(mapping_name)
         return self
 
     def list_of(self, inside_instanciator=None, instanciator=list):
@@ -578,6 +1832,7 @@ class Field:
             Field: self
         """
         self.default_value = value
+        self.notify_change()
         return self
 
     def converter(self, loads=None, dumps=None):
@@ -596,6 +1851,48 @@ class Field:
             self.loads_converter = loads
         return self
 
+    def converter_attr(self, loads=None, dumps=None):
+        """Set converters reading an attribute of the value
+
+        Same as converter() with operator.attrgetter() functions, faster than
+        an equivalent lambda function.
+
+        eg:
+            converter_attr(dumps="value") for an enum
+
+        Keyword Arguments:
+            loads (str): attribute name used to convert values loaded
+            dumps (str): attribute name used to convert values dumped
+
+        Returns:
+            Field: self
+        """
+        return self.converter(
+            loads=None if loads is None else operator.attrgetter(loads),
+            dumps=None if dumps is None else operator.attrgetter(dumps),
+        )
+
+    def converter_method(self, loads=None, dumps=None):
+        """Set converters calling a method of the value
+
+        Same as converter() with operator.methodcaller() functions, faster
+        than an equivalent lambda function.
+
+        eg:
+            converter_method(dumps="isoformat") for a datetime
+
+        Keyword Arguments:
+            loads (str): method name used to convert values loaded
+            dumps (str): method name used to convert values dumped
+
+        Returns:
+            Field: self
+        """
+        return self.converter(
+            loads=None if loads is None else operator.methodcaller(loads),
+            dumps=None if dumps is None else operator.methodcaller(dumps),
+        )
+
     def match(self, name):
         """This field match a name
 
@@ -605,12 +1902,7 @@ class Field:
         Returns:
             bool: True - match, False - Doesn't match
         """
-        if self.name == name:
-            return True
-        if self.mapping_name and self.mapping_name == name:
-            return True
-
-        return False
+        return name in self._match_set
 
     def get_instance(self, typing_instance):
         """Get the default value or new instance from instanciator
@@ -644,11 +1936,72 @@ class Field:
         if self.inside_instanciator is None:
             return data
 
+        if type(data) is self.inside_instanciator and _is_identity_converter(
+            self.inside_instanciator
+        ):
+            return data
+
         if issubclass(self.inside_instanciator, Typing2):
             return self.inside_instanciator(data, parent=typing_instance)
 
         return self.inside_instanciator(data)
 
+    def get_inside_instances(self, data, typing_instance):
+        """Get default values or new instances from inside_instanciator
+
+        For list content only
+
+        Args:
+            data (object): enumerable of data to load passed to the instanciator
+            typing_instance (Typing2): The parent instance
+
+        Returns:
+            list: default values or new instances
+        """
+        inside_instanciator = self.inside_instanciator
+
+        if type(self).get_inside_instance is not Field.get_inside_instance:
+            get_inside_instance = self.get_inside_instance
+            return [get_inside_instance(item, typing_instance) for item in data]
+
+        if inside_instanciator is None:
+            return list(data)
+
+        if _is_identity_converter(inside_instanciator):
+            return [
+                item if type(item) is inside_instanciator else inside_instanciator(item)
+                for item in data
+            ]
+
+        if issubclass(inside_instanciator, Typing2):
+            return [inside_instanciator(item, parent=typing_instance) for item in data]
+
+        return [inside_instanciator(item) for item in data]
+
+    def is_typing_list(self):
+        """This field is a list of Typing objects built by get_inside_instance()
+
+        Returns:
+            bool: True - items can be loaded from another Typing object directly
+        """
+        return (
+            self.is_plain_list()
+            and isinstance(self.inside_instanciator, type)
+            and issubclass(self.inside_instanciator, Typing2)
+        )
+
+    def is_plain_list(self):
+        """This field is a list using the default get_inside_instance(s)()
+
+        Returns:
+            bool: True - items are only built by inside_instanciator
+        """
+        return (
+            self.is_list
+            and type(self).get_inside_instance is Field.get_inside_instance
+            and type(self).get_inside_instances is Field.get_inside_instances
+        )
+
     def loads_convert(self, value):
         """Convert a value (loaders)
 
@@ -658,10 +2011,29 @@ class Field:
         Returns:
             object: a converted value
         """
-        if self.loads_converter is None or value is None:
+        converter = self.loads_converter
+
+        if converter is None or value is None:
+            return value
+
+        if type(value) is converter and _is_identity_converter(converter):
             return value
 
-        return self.loads_converter(value)
+        return converter(value)
+
+    def get_dumps_convert(self):
+        """Get the dumps conversion function
+
+        Returns:
+            function: dumps_convert() or None if there is nothing to convert
+        """
+        if (
+            self.dumps_converter is None
+            and type(self).dumps_convert is Field.dumps_convert
+        ):
+            return None
+
+        return self.dumps_convert
 
     def dumps_convert(self, value):
         """Convert a value (dumps)
@@ -672,10 +2044,15 @@ class Field:
         Returns:
             object: a converted value
         """
-        if self.dumps_converter is None or value is None:
+        converter = self.dumps_converter
+
+        if converter is None or value is None:
+            return value
+
+        if type(value) is converter and _is_identity_converter(converter):
             return value
 
-        return self.dumps_converter(value)
+        return converter(value)
 
 
 class vField(Field):
@@ -687,39 +2064,43 @@ class vField(Field):
     from/for other variables.
     """
 
+    __slots__ = ()
+
+    def _compile(self, owner):
+        """Compile the getter and setter functions
+
+        Getters are applied on the default value and
+        setters result is not stored.
+
+        Args:
+            owner (class): the class of the instance that is accessed
+        """
+        namespace = {"field": self}
+
+        # getter
+        lines = ["def get(instance):", "    value = field.default_value"]
+        lines += self._compile_getters(namespace)
+        lines.append("    return value")
+        self._get_fn = _compile_function("get", lines, namespace)
+
+        # setter
+        lines = ["def set(instance, value):"]
+        lines += self._compile_setters(namespace) or ["    pass"]
+        self._set_fn = _compile_function("set", lines, namespace)
+
     def __get__(self, instance, owner):
         """Getter"""
         if instance is None:
             return self
 
-        # Default value
-        value = self.default_value
-
-        # getters
-        for func in self.getters_funcs:
-            if type(func).__name__ == "method":
-                # dynamic
-                value = func(value)
-            else:
-                # static
-                value = func(instance, value)
-
-        return value
+        return self._get_fn(instance)
 
     def __set__(self, instance, value):
         """Setter
 
         Can convert value if loads converter is set.
         """
-        value = self.loads_convert(value)
-
-        for func in self.setters_funcs:
-            if type(func).__name__ == "method":
-                # dynamic
-                value = func(value)
-            else:
-                # static
-                value = func(instance, value)
+        self._set_fn(instance, value)
 
     def __delete__(self, instance):
         pass